@@ -11,7 +11,7 @@ from presence_tracker.bluetooth import BlueZPresenceMonitor, normalize_mac
 from presence_tracker.state import load_known_macs
 from presence_tracker.config import Config
 from presence_tracker.convex_client import ConvexClient
-from presence_tracker.logging_utils import configure_logging, log_event
+from presence_tracker.logging_utils import configure_logging, log_event, shutdown_logging
 from presence_tracker.presence_loop import PresenceLoop
 
 
@@ -80,6 +80,7 @@ async def run() -> None:
         )
 
     presence = PresenceLoop(config, convex, monitor)
+    monitor.on_connection_event = presence.notify_device_event
     try:
         if args.once:
             await presence.run_cycle()
@@ -105,6 +106,7 @@ async def run() -> None:
         await convex.close()
         await monitor.close()
         log_event("main", "shutdown", result="ok", message="agent stopped")
+        shutdown_logging()
 
 
 if __name__ == "__main__":
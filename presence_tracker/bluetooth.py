@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
 import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Awaitable, Callable
 
-from dbus_next import BusType, Variant
+from dbus_next import BusType, Message, MessageType, Variant
 from dbus_next.aio import MessageBus
 from dbus_next.errors import DBusError
 from dbus_next.service import ServiceInterface, method
@@ -27,6 +29,16 @@ AGENT_PATH = "/com/hdsi/presence_tracker/agent"
 
 MAC_RE = re.compile(r"^[0-9A-F]{2}(:[0-9A-F]{2}){5}$")
 
+# Variants are immutable once marshalled, so share the common ones instead of
+# boxing a fresh object on every property write.
+VARIANT_TRUE = Variant("b", True)
+VARIANT_UINT32_ZERO = Variant("u", 0)
+
+# Safety net for the signal-maintained object cache: even with
+# InterfacesAdded/Removed and PropertiesChanged keeping it current, do a full
+# resync this often in case a signal was dropped.
+OBJECTS_RESYNC_SECONDS = 300.0
+
 
 @dataclass(slots=True)
 class CommandOutput:
@@ -42,7 +54,7 @@ class PassiveSighting:
 
 
 class PresenceAgent(ServiceInterface):
-    def __init__(self, audio_uuids: set[str]) -> None:
+    def __init__(self, audio_uuids: frozenset[str]) -> None:
         super().__init__(AGENT)
         self.audio_uuids = audio_uuids
 
@@ -96,14 +108,29 @@ class PresenceAgent(ServiceInterface):
 class BlueZPresenceMonitor:
     def __init__(self, config: BluetoothConfig) -> None:
         self.config = config
-        self.audio_uuids = {uuid.strip().lower() for uuid in config.audio_block_uuids if uuid.strip()}
+        self.audio_uuids = frozenset(uuid.strip().lower() for uuid in config.audio_block_uuids if uuid.strip())
         self.bus: MessageBus | None = None
         self.adapter_path = ""
         self.agent = PresenceAgent(self.audio_uuids)
         self.seen_paired: set[str] = set()
+        self._trusted_macs: set[str] = set()
+        self._audio_capable: dict[str, bool] = {}
         self.passive_seen_at: dict[str, PassiveSighting] = {}
-        self.watched_device_paths: set[str] = set()
+        self.connected_state: dict[str, bool] = {}
+        self._connected_events: dict[str, asyncio.Event] = {}
+        # Invoked (synchronously, from the bus message handler) whenever a
+        # device's Connected state flips; lets the presence loop wake early
+        # instead of waiting out its polling interval.
+        self.on_connection_event: Callable[[], None] | None = None
+        self._last_passive_prune = 0.0
+        self._pairing_tasks: set[asyncio.Task[None]] = set()
         self._connect_lock = asyncio.Lock()
+        self._iface_cache: dict[tuple[str, str, str], Any] = {}
+        self._objects: dict[str, dict[str, dict[str, Any]]] | None = None
+        self._objects_synced_at = 0.0
+        self._objects_signals_ok = False
+        self._om_handlers_installed = False
+        self._props_handler_installed = False
         self._probe_batch_depth = 0
         self._probe_semaphore = asyncio.Semaphore(max(1, config.max_concurrent_probes))
         # HCI can only service one L2CAP ping at a time; parallel l2ping silently fails.
@@ -115,20 +142,151 @@ class BlueZPresenceMonitor:
                 self.seen_paired.add(normalize_mac(mac))
 
     async def connect(self) -> None:
-        self.bus = await MessageBus(bus_type=BusType.SYSTEM).connect()
+        # The agent never passes file descriptors, so keep FD negotiation off
+        # and skip that step of the authentication handshake.
+        self.bus = await MessageBus(bus_type=BusType.SYSTEM, negotiate_unix_fd=False).connect()
         await self.refresh_adapter_path()
+        await self._ensure_event_subscriptions()
+
+    async def _ensure_event_subscriptions(self) -> None:
+        """(Re)install the object-manager and property signal subscriptions.
+
+        The object cache, connected-state cache, connect-probe waits, and
+        passive sightings all depend on these signals, so a transient failure
+        at startup must not pin the monitor in degraded mode for the life of
+        the process; the pairing monitor retries this every pass until it
+        sticks. Handler registration is guarded so a retry after a partial
+        failure never double-subscribes.
+        """
+        if self._objects_signals_ok:
+            return
+        try:
+            if not self._om_handlers_installed:
+                manager = await self._interface(BLUEZ, "/", OBJECT_MANAGER)
+                manager.on_interfaces_added(self._on_interfaces_added)
+                manager.on_interfaces_removed(self._on_interfaces_removed)
+                self._om_handlers_installed = True
+            await self._subscribe_device_property_signals()
+            self._objects_signals_ok = True
+        except Exception as exc:
+            log_event("bluetooth", "event_listener", result="error", message=str(exc), level=logging.WARNING)
+
+    async def _subscribe_device_property_signals(self) -> None:
+        """Register one broad Device1 PropertiesChanged match for all devices.
+
+        A match rule per device path would grow without bound as devices churn
+        through discovery and eventually trip the daemon's per-connection match
+        limit; one arg0-scoped rule with Python-side dispatch by path covers
+        every device for a single slot.
+        """
+        if not self.bus:
+            raise RuntimeError("D-Bus is not connected")
+        if not self._props_handler_installed:
+            self.bus.add_message_handler(self._on_properties_changed_message)
+            self._props_handler_installed = True
+        rule = f"type='signal',interface='{PROPERTIES}',member='PropertiesChanged',arg0='{DEVICE}'"
+        reply = await self.bus.call(
+            Message(
+                destination="org.freedesktop.DBus",
+                path="/org/freedesktop/DBus",
+                interface="org.freedesktop.DBus",
+                member="AddMatch",
+                signature="s",
+                body=[rule],
+            )
+        )
+        if reply is not None and reply.message_type == MessageType.ERROR:
+            raise DBusError(reply.error_name, reply.body[0] if reply.body else "")
+
+    def _on_properties_changed_message(self, msg: Message) -> None:
+        if (
+            msg.message_type != MessageType.SIGNAL
+            or msg.interface != PROPERTIES
+            or msg.member != "PropertiesChanged"
+            or not msg.body
+            or msg.body[0] != DEVICE
+        ):
+            return
+        mac = path_to_mac(msg.path or "")
+        if not mac:
+            return
+        changed = msg.body[1] if len(msg.body) > 1 else {}
+        invalidated = msg.body[2] if len(msg.body) > 2 else []
+        self._patch_cached_device(msg.path, changed, invalidated)
+        self._record_property_change(mac, changed)
+
+    def _on_interfaces_added(self, path: str, interfaces: dict[str, dict[str, Any]]) -> None:
+        if self._objects is not None:
+            self._objects.setdefault(path, {}).update(interfaces)
+
+    def _on_interfaces_removed(self, path: str, interfaces: list[str]) -> None:
+        if self._objects is not None:
+            entry = self._objects.get(path)
+            if entry is not None:
+                for name in interfaces:
+                    entry.pop(name, None)
+                if not entry:
+                    del self._objects[path]
+        # Cached proxies for a removed object would pin stale introspection
+        # data; drop them so a re-appearing device gets a fresh proxy.
+        for key in [key for key in self._iface_cache if key[1] == path]:
+            del self._iface_cache[key]
+        mac = path_to_mac(path)
+        if mac:
+            self._trusted_macs.discard(mac)
+            self.connected_state.pop(mac, None)
+            self._audio_capable.pop(mac, None)
 
     async def close(self) -> None:
         if not self.bus:
             return
         try:
-            manager = await self._interface(BLUEZ, BLUEZ_PATH, AGENT_MANAGER)
-            await manager.call_unregister_agent(AGENT_PATH)
+            await self._call_agent_manager("UnregisterAgent", "o", [AGENT_PATH])
         except Exception:
             pass
         self.bus.disconnect()
 
+    async def _call_agent_manager(self, member: str, signature: str = "", body: list[Any] | None = None) -> None:
+        """Call AgentManager1 with a raw message, skipping proxy introspection.
+
+        The agent manager is only touched at startup and shutdown for three
+        fixed calls, so a full introspected proxy buys nothing here.
+        """
+        if not self.bus:
+            raise RuntimeError("D-Bus is not connected")
+        reply = await self.bus.call(
+            Message(
+                destination=BLUEZ,
+                path=BLUEZ_PATH,
+                interface=AGENT_MANAGER,
+                member=member,
+                signature=signature,
+                body=body or [],
+            )
+        )
+        if reply is not None and reply.message_type == MessageType.ERROR:
+            raise DBusError(reply.error_name, reply.body[0] if reply.body else "")
+
     async def refresh_adapter_path(self) -> None:
+        # A previously resolved path stays valid for the life of the adapter;
+        # only re-scan when it has gone away.
+        if self.adapter_path:
+            try:
+                await self._interface(BLUEZ, self.adapter_path, ADAPTER)
+            except Exception:
+                pass
+            else:
+                return
+        # The adapter almost always sits at the conventional path, so try that
+        # directly before serializing the whole BlueZ object tree.
+        candidate = f"/org/bluez/{self.config.adapter_name}" if self.config.adapter_name else "/org/bluez/hci0"
+        try:
+            await self._interface(BLUEZ, candidate, ADAPTER)
+        except Exception:
+            pass
+        else:
+            self.adapter_path = candidate
+            return
         objects = await self.get_managed_objects()
         adapter_paths = sorted(path for path, ifaces in objects.items() if ADAPTER in ifaces)
         if not adapter_paths:
@@ -144,23 +302,22 @@ class BlueZPresenceMonitor:
         if not self.bus:
             raise RuntimeError("D-Bus is not connected")
         self.bus.export(AGENT_PATH, self.agent)
-        manager = await self._interface(BLUEZ, BLUEZ_PATH, AGENT_MANAGER)
         try:
-            await manager.call_register_agent(AGENT_PATH, "NoInputNoOutput")
+            await self._call_agent_manager("RegisterAgent", "os", [AGENT_PATH, "NoInputNoOutput"])
         except DBusError as exc:
-            if "AlreadyExists" not in str(exc):
+            if not dbus_error_matches(exc, "AlreadyExists"):
                 raise
-        await manager.call_request_default_agent(AGENT_PATH)
+        await self._call_agent_manager("RequestDefaultAgent", "o", [AGENT_PATH])
         log_event("bluetooth_agent", "agent_started", result="ok", message="NoInputNoOutput agent registered")
 
     async def configure_adapter(self, alias: str) -> None:
         if not await self.ensure_adapter_ready():
             raise RuntimeError(f"Bluetooth adapter not ready: {self.adapter_path}")
         adapter_props = await self._interface(BLUEZ, self.adapter_path, PROPERTIES)
-        await self._safe_set(adapter_props, ADAPTER, "Pairable", Variant("b", True))
-        await self._safe_set(adapter_props, ADAPTER, "Discoverable", Variant("b", True))
-        await self._safe_set(adapter_props, ADAPTER, "DiscoverableTimeout", Variant("u", 0))
-        await self._safe_set(adapter_props, ADAPTER, "PairableTimeout", Variant("u", 0))
+        await self._safe_set(adapter_props, ADAPTER, "Pairable", VARIANT_TRUE)
+        await self._safe_set(adapter_props, ADAPTER, "Discoverable", VARIANT_TRUE)
+        await self._safe_set(adapter_props, ADAPTER, "DiscoverableTimeout", VARIANT_UINT32_ZERO)
+        await self._safe_set(adapter_props, ADAPTER, "PairableTimeout", VARIANT_UINT32_ZERO)
         if alias:
             await self._safe_set(adapter_props, ADAPTER, "Alias", Variant("s", alias))
         log_event("bluetooth", "configure_adapter", result="ok", message=self.adapter_path)
@@ -186,7 +343,7 @@ class BlueZPresenceMonitor:
             )
             adapter_props = await self._interface(BLUEZ, self.adapter_path, PROPERTIES)
             try:
-                await adapter_props.call_set(ADAPTER, "Powered", Variant("b", True))
+                await adapter_props.call_set(ADAPTER, "Powered", VARIANT_TRUE)
             except Exception as exc:
                 log_event(
                     "bluetooth",
@@ -227,6 +384,20 @@ class BlueZPresenceMonitor:
             )
             return
         adapter = await self._interface(BLUEZ, self.adapter_path, ADAPTER)
+        # Filter advertisements below the passive-presence threshold in BlueZ
+        # and drop duplicate advertising data; both only shed signal traffic
+        # we would discard anyway (presence keys off RSSI changes). Older
+        # stacks without SetDiscoveryFilter just scan unfiltered.
+        try:
+            await adapter.call_set_discovery_filter(
+                {
+                    "Transport": Variant("s", "auto"),
+                    "RSSI": Variant("n", self.config.min_passive_rssi),
+                    "DuplicateData": Variant("b", False),
+                }
+            )
+        except Exception as exc:
+            log_event("bluetooth", "discovery_filter", result="ignored", message=str(exc))
         for attempt in range(5):
             try:
                 await adapter.call_start_discovery()
@@ -309,60 +480,63 @@ class BlueZPresenceMonitor:
 
     async def get_connected_devices(self) -> set[str]:
         objects = await self.get_managed_objects()
-        connected: set[str] = set()
-        for path, ifaces in objects.items():
-            device = ifaces.get(DEVICE)
-            if not device:
-                continue
-            if _variant_value(device.get("Connected")) is True:
-                mac = path_to_mac(path)
-                if mac:
-                    connected.add(mac)
-        return connected
+        return set(self._devices_with_flag(objects, "Connected"))
 
     async def get_paired_devices(self) -> dict[str, str]:
-        objects = await self.get_managed_objects()
-        paired: dict[str, str] = {}
-        for path, ifaces in objects.items():
-            device = ifaces.get(DEVICE)
-            if not device:
-                continue
-            if _variant_value(device.get("Paired")) is True:
-                mac = path_to_mac(path)
-                if mac:
-                    paired[mac] = path
-        return paired
+        return self._paired_devices_from_objects(await self.get_managed_objects())
 
     async def get_device_name(self, mac: str) -> str | None:
         path = await self.device_path(mac)
         if not path:
             return None
+        # One cached-tree lookup covers both properties; issuing two Get round
+        # trips (or even a parallel pair) per pairing event is strictly slower.
         props = await self.get_device_properties(path)
         value = _variant_value(props.get("Name")) or _variant_value(props.get("Alias"))
         return str(value) if value else None
 
     async def is_device_connected(self, mac: str) -> bool:
+        # Watched devices keep their Connected state current via
+        # PropertiesChanged, so answer from the cache without a D-Bus read.
+        cached = self.connected_state.get(normalize_mac(mac))
+        if cached is not None:
+            return cached
         path = await self.device_path(mac)
         if not path:
             return False
-        props = await self.get_device_properties(path)
-        return _variant_value(props.get("Connected")) is True
+        return await self._get_device_property(path, "Connected") is True
 
     async def device_has_audio_services(self, mac: str) -> bool:
+        mac = normalize_mac(mac)
+        cached = self._audio_capable.get(mac)
+        if cached is not None:
+            return cached
         path = await self.device_path(mac)
         if not path:
             return False
-        props = await self.get_device_properties(path)
-        uuids = _variant_value(props.get("UUIDs")) or []
-        return has_audio_uuid([str(uuid) for uuid in uuids], self.audio_uuids)
+        uuids = await self._get_device_property(path, "UUIDs") or []
+        capable = has_audio_uuid([str(uuid) for uuid in uuids], self.audio_uuids)
+        # UUIDs are empty until service discovery completes, so only cache an
+        # answer backed by a resolved service list.
+        if uuids:
+            self._audio_capable[mac] = capable
+        return capable
 
     async def trust_device(self, mac: str) -> bool:
+        mac = normalize_mac(mac)
+        if mac in self._trusted_macs:
+            return True
         path = await self.device_path(mac)
         if not path:
             return False
+        cached = await self.get_device_properties(path)
+        if _variant_value(cached.get("Trusted")) is True:
+            self._trusted_macs.add(mac)
+            return True
         try:
             props = await self._interface(BLUEZ, path, PROPERTIES)
-            await props.call_set(DEVICE, "Trusted", Variant("b", True))
+            await props.call_set(DEVICE, "Trusted", VARIANT_TRUE)
+            self._trusted_macs.add(mac)
             return True
         except Exception as exc:
             log_event("bluetooth", "trust", mac=mac, result="error", message=str(exc), level=logging.WARNING)
@@ -372,6 +546,7 @@ class BlueZPresenceMonitor:
         if not is_valid_mac(mac):
             return False
         mac = normalize_mac(mac)
+        self._trusted_macs.discard(mac)
         path = await self.device_path(mac)
         if not path:
             return await self.remove_device_fallback(mac)
@@ -380,7 +555,7 @@ class BlueZPresenceMonitor:
             await adapter.call_remove_device(path)
             return True
         except DBusError as exc:
-            if any(text in str(exc).lower() for text in ("does not exist", "not available", "not found")):
+            if dbus_error_matches(exc, "DoesNotExist", "does not exist", "not available", "not found"):
                 return True
             log_event("bluetooth", "remove", mac=mac, result="error", message=str(exc), level=logging.WARNING)
             return False
@@ -453,12 +628,20 @@ class BlueZPresenceMonitor:
 
     async def begin_probe_batch(self) -> None:
         async with self._connect_lock:
-            if self._probe_batch_depth == 0:
-                await self.stop_discovery()
-                for mac in await self.get_connected_devices():
-                    await self.disconnect_audio_capable_device(mac)
-                await asyncio.sleep(0.3)
+            # Raise the depth before the disconnect sweep: the Connected flips
+            # it causes are delivered while these awaits run, and the wake
+            # suppression in _record_property_change keys on the depth. Roll
+            # back on failure so an aborted batch does not pin the depth high.
             self._probe_batch_depth += 1
+            if self._probe_batch_depth == 1:
+                try:
+                    await self.stop_discovery()
+                    for mac in await self.get_connected_devices():
+                        await self.disconnect_audio_capable_device(mac)
+                    await asyncio.sleep(0.3)
+                except BaseException:
+                    self._probe_batch_depth -= 1
+                    raise
 
     async def end_probe_batch(self) -> None:
         async with self._connect_lock:
@@ -488,25 +671,66 @@ class BlueZPresenceMonitor:
                 return True
             last_error = error
             if attempt < attempts - 1:
-                await asyncio.sleep(0.5)
+                # Jitter the retry delay so probes for several out-of-range
+                # devices do not re-hit the controller in lockstep.
+                await asyncio.sleep(0.5 + random.uniform(0.0, 0.5))
         if last_error:
             log_event("bluetooth", "connect_probe", mac=mac, result="failed", message=last_error)
         return False
 
     async def _connect_probe_once(self, mac: str) -> tuple[bool, str]:
         mac = normalize_mac(mac)
-        out = await run_command(
-            "bluetoothctl",
-            ["connect", mac],
-            self.config.connect_probe_timeout_seconds,
-        )
-        deadline = time.monotonic() + self.config.connect_probe_timeout_seconds
-        while time.monotonic() < deadline:
+        # Arm the event before issuing the connect so a fast PropertiesChanged
+        # cannot race past us; the signal wakes the wait immediately instead of
+        # a 250ms poll loop burning round trips.
+        event = self._connected_events.setdefault(mac, asyncio.Event())
+        event.clear()
+        try:
+            path = await self.device_path(mac)
+            if path and await self._dbus_connect(path):
+                return True, ""
+            # Known-device Connect failed or the device is not in the object
+            # tree yet; bluetoothctl also triggers discovery-assisted connects.
+            out = await run_command(
+                "bluetoothctl",
+                ["connect", mac],
+                self.config.connect_probe_timeout_seconds,
+            )
             if command_output_indicates_connect_success(out) or await self.is_device_connected(mac):
                 return True, ""
-            await asyncio.sleep(0.25)
-        combined = f"{out.stdout}\n{out.stderr}".strip()
-        return False, combined or f"exit={out.code}"
+            try:
+                await asyncio.wait_for(event.wait(), timeout=self.config.connect_probe_timeout_seconds)
+                return True, ""
+            except asyncio.TimeoutError:
+                pass
+            if await self.is_device_connected(mac):
+                return True, ""
+            combined = f"{out.stdout}\n{out.stderr}".strip()
+            return False, combined or f"exit={out.code}"
+        finally:
+            self._connected_events.pop(mac, None)
+
+    async def _dbus_connect(self, path: str) -> bool:
+        """Try Device1.Connect in-process before falling back to bluetoothctl.
+
+        The subprocess fallback costs a fork/exec plus bluetoothctl startup on
+        every probe; the direct call is the same BlueZ operation without it.
+        """
+        try:
+            device = await self._interface(BLUEZ, path, DEVICE)
+            await asyncio.wait_for(
+                device.call_connect(),
+                timeout=self.config.connect_probe_timeout_seconds,
+            )
+            return True
+        except asyncio.TimeoutError:
+            return False
+        except DBusError as exc:
+            if dbus_error_matches(exc, "AlreadyConnected", "already connected"):
+                return True
+            return False
+        except Exception:
+            return False
 
     async def monitor_new_pairings(
         self,
@@ -522,7 +746,7 @@ class BlueZPresenceMonitor:
                 return
             if _variant_value(device.get("Paired")) is True:
                 scheduled.add(mac)
-                asyncio.create_task(self.handle_new_pairing(mac, register_pending))
+                self._spawn_pairing_task(mac, register_pending)
 
         try:
             manager.on_interfaces_added(on_interfaces_added)
@@ -531,17 +755,30 @@ class BlueZPresenceMonitor:
 
         while True:
             try:
+                await self._ensure_event_subscriptions()
                 objects = await self.get_managed_objects()
-                await self._watch_device_property_changes(objects)
                 paired = self._paired_devices_from_objects(objects)
                 for mac in sorted(set(paired) - self.seen_paired):
-                    await self.handle_new_pairing(mac, register_pending)
+                    # Registration involves a connect probe that can take
+                    # seconds; run it as a task so one slow pairing does not
+                    # stall detection of the others.
+                    self._spawn_pairing_task(mac, register_pending)
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
                 log_event("bluetooth_agent", "pairing_monitor", result="error", message=str(exc), level=logging.WARNING)
             await asyncio.sleep(5)
 
+    def _spawn_pairing_task(
+        self,
+        mac: str,
+        register_pending: Callable[[str, str | None, str | None], Awaitable[None]],
+    ) -> None:
+        task = asyncio.create_task(self.handle_new_pairing(mac, register_pending))
+        # Hold a reference until completion; the loop only keeps weak refs.
+        self._pairing_tasks.add(task)
+        task.add_done_callback(self._pairing_tasks.discard)
+
     async def handle_new_pairing(
         self,
         mac: str,
@@ -582,43 +819,92 @@ class BlueZPresenceMonitor:
                 return path
         return None
 
+    async def _get_device_property(self, path: str, name: str) -> Any:
+        """Read one Device1 property instead of marshalling the whole tree.
+
+        GetManagedObjects serializes every property of every object, including
+        large ones like ManufacturerData; a targeted Get only moves one value.
+        Returns None when the property is unset or the device vanished.
+        """
+        try:
+            props = await self._interface(BLUEZ, path, PROPERTIES)
+            return _variant_value(await props.call_get(DEVICE, name))
+        except DBusError:
+            return None
+
     async def get_device_properties(self, path: str) -> dict[str, Any]:
         objects = await self.get_managed_objects()
         return dict(objects.get(path, {}).get(DEVICE, {}))
 
     async def get_managed_objects(self) -> dict[str, dict[str, dict[str, Any]]]:
+        # GetManagedObjects serializes the whole BlueZ tree and is called from
+        # every snapshot-style helper; serve from the signal-maintained cache
+        # and only hit the bus for the initial seed and the periodic resync.
+        # Without signal subscriptions the cache cannot stay correct, so fall
+        # back to fetching fresh every time.
+        if self._objects_signals_ok:
+            now = time.monotonic()
+            if self._objects is None or (now - self._objects_synced_at) > OBJECTS_RESYNC_SECONDS:
+                manager = await self._interface(BLUEZ, "/", OBJECT_MANAGER)
+                self._objects = await manager.call_get_managed_objects()
+                self._objects_synced_at = now
+                self._seed_connected_state(self._objects)
+            # Shallow copy so callers can iterate, filter, or drop entries
+            # without corrupting the live cache; the nested interface dicts
+            # remain shared and are read-only by convention.
+            return dict(self._objects)
         manager = await self._interface(BLUEZ, "/", OBJECT_MANAGER)
         return await manager.call_get_managed_objects()
 
-    async def _watch_device_property_changes(self, objects: dict[str, dict[str, dict[str, Any]]]) -> None:
+    def _seed_connected_state(self, objects: dict[str, dict[str, dict[str, Any]]]) -> None:
+        # A full tree fetch is authoritative; rebuild the signal-driven cache
+        # from scratch rather than patching it in place, so a device whose
+        # removal signal was dropped and that BlueZ has since forgotten does
+        # not linger as a phantom connection across resyncs.
+        state: dict[str, bool] = {}
         for path, ifaces in objects.items():
-            if DEVICE not in ifaces or path in self.watched_device_paths:
+            device = ifaces.get(DEVICE)
+            if not device:
                 continue
             mac = path_to_mac(path)
-            if not mac:
-                continue
-            try:
-                props = await self._interface(BLUEZ, path, PROPERTIES)
-            except Exception as exc:
-                log_event("bluetooth", "watch_device", mac=mac, result="error", message=str(exc), level=logging.WARNING)
-                continue
+            if mac:
+                state[mac] = _variant_value(device.get("Connected")) is True
+        self.connected_state = state
 
-            def make_handler(watched_mac: str) -> Callable[[str, dict[str, Any], list[str]], None]:
-                def on_properties_changed(
-                    interface_name: str,
-                    changed_properties: dict[str, Any],
-                    invalidated_properties: list[str],
-                ) -> None:
-                    if interface_name != DEVICE:
-                        return
-                    self._record_property_change(watched_mac, changed_properties)
-
-                return on_properties_changed
-
-            props.on_properties_changed(make_handler(mac))
-            self.watched_device_paths.add(path)
+    def _patch_cached_device(
+        self,
+        path: str,
+        changed_properties: dict[str, Any],
+        invalidated_properties: list[str],
+    ) -> None:
+        if self._objects is None:
+            return
+        device = self._objects.get(path, {}).get(DEVICE)
+        if device is None:
+            return
+        device.update(changed_properties)
+        for name in invalidated_properties:
+            device.pop(name, None)
 
     def _record_property_change(self, mac: str, changed_properties: dict[str, Any]) -> None:
+        if "Connected" in changed_properties:
+            is_connected = _variant_value(changed_properties["Connected"]) is True
+            mac_norm = normalize_mac(mac)
+            previous = self.connected_state.get(mac_norm)
+            self.connected_state[mac_norm] = is_connected
+            if is_connected:
+                event = self._connected_events.get(mac_norm)
+                if event is not None:
+                    event.set()
+            # Probe batches disconnect every OS-connected device up front and
+            # connect probes bounce devices on purpose; waking the presence
+            # loop on those self-induced flips would feed it its own churn.
+            if (
+                previous != is_connected
+                and self._probe_batch_depth == 0
+                and self.on_connection_event is not None
+            ):
+                self.on_connection_event()
         # Only a live advertisement with a credible RSSI counts as a passive sighting.
         # ManufacturerData/AdvertisingFlags alone are too noisy for paired-but-away devices.
         # We deliberately do NOT clear presence on property *invalidation*: BlueZ
@@ -629,8 +915,22 @@ class BlueZPresenceMonitor:
             return
         if rssi < self.config.min_passive_rssi:
             return
-        self.passive_seen_at[normalize_mac(mac)] = PassiveSighting(time.monotonic(), rssi)
+        now = time.monotonic()
+        self.passive_seen_at[normalize_mac(mac)] = PassiveSighting(now, rssi)
         log_event("bluetooth", "passive_seen", mac=mac, result="event", message=f"rssi={rssi}")
+        self._prune_passive_sightings(now)
+
+    def _prune_passive_sightings(self, now: float) -> None:
+        # Discovery sees every passer-by, so without pruning the sighting map
+        # grows for the life of the process. Expired entries can never count
+        # as present again; sweep them at most once per TTL window.
+        ttl = self.config.passive_presence_ttl_seconds
+        if now - self._last_passive_prune < ttl:
+            return
+        self._last_passive_prune = now
+        expired = [mac for mac, sighting in self.passive_seen_at.items() if now - sighting.seen_at > ttl]
+        for mac in expired:
+            del self.passive_seen_at[mac]
 
     async def is_device_passively_present(self, mac: str) -> bool:
         if not is_valid_mac(mac):
@@ -646,23 +946,36 @@ class BlueZPresenceMonitor:
         return True
 
     def _paired_devices_from_objects(self, objects: dict[str, dict[str, dict[str, Any]]]) -> dict[str, str]:
-        paired: dict[str, str] = {}
+        return self._devices_with_flag(objects, "Paired")
+
+    @staticmethod
+    def _devices_with_flag(objects: dict[str, dict[str, dict[str, Any]]], flag: str) -> dict[str, str]:
+        """Map MAC -> object path for devices whose boolean property is set."""
+        found: dict[str, str] = {}
         for path, ifaces in objects.items():
             device = ifaces.get(DEVICE)
             if not device:
                 continue
-            if _variant_value(device.get("Paired")) is True:
+            if _variant_value(device.get(flag)) is True:
                 mac = path_to_mac(path)
                 if mac:
-                    paired[mac] = path
-        return paired
+                    found[mac] = path
+        return found
 
     async def _interface(self, bus_name: str, path: str, interface_name: str) -> Any:
         if not self.bus:
             raise RuntimeError("D-Bus is not connected")
+        # Introspection is a full D-Bus round trip, so reuse proxy interfaces
+        # across the agent callbacks and probe cycles that hit the same paths.
+        key = (bus_name, path, interface_name)
+        cached = self._iface_cache.get(key)
+        if cached is not None:
+            return cached
         introspection = await self.bus.introspect(bus_name, path)
         obj = self.bus.get_proxy_object(bus_name, path, introspection)
-        return obj.get_interface(interface_name)
+        interface = obj.get_interface(interface_name)
+        self._iface_cache[key] = interface
+        return interface
 
     async def _safe_set(self, props: Any, interface_name: str, prop: str, value: Variant) -> None:
         try:
@@ -734,7 +1047,11 @@ async def remote_name_probe_device(mac: str, timeout_seconds: int) -> bool:
     return command_output_indicates_remote_name_success(out)
 
 
+@lru_cache(maxsize=1024)
 def normalize_mac(mac: str) -> str:
+    # The set of MACs a deployment sees is small and stable, and this runs on
+    # every probe, signal and snapshot key; cache the normalized strings so
+    # repeat calls return the same interned object without allocating.
     return mac.strip().upper()
 
 
@@ -750,7 +1067,7 @@ def path_to_mac(path: str) -> str | None:
     return mac if is_valid_mac(mac) else None
 
 
-def has_audio_uuid(uuids: list[str], blocked: set[str]) -> bool:
+def has_audio_uuid(uuids: list[str], blocked: frozenset[str] | set[str]) -> bool:
     return any(uuid.strip().lower() in blocked for uuid in uuids)
 
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+_queue_listener: QueueListener | None = None
+
 
 class LineCappedFileHandler(logging.FileHandler):
     def __init__(self, filename: Path, max_lines: int) -> None:
@@ -45,15 +49,34 @@ def configure_logging(log_file: Path, max_lines: int) -> None:
 
     stream = logging.StreamHandler()
     stream.setFormatter(formatter)
-    root.addHandler(stream)
+    handlers: list[logging.Handler] = [stream]
 
     try:
         file_handler = LineCappedFileHandler(log_file, max_lines)
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
     except OSError as exc:
         logging.warning("file logging disabled for %s: %s", log_file, exc)
 
+    # Emit through a queue so probe cycles and agent callbacks never block on
+    # disk writes (or the periodic trim); a background thread drains to the
+    # real handlers.
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    _queue_listener = QueueListener(log_queue, *handlers)
+    _queue_listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread (call on exit)."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def log_event(
     component: str,
@@ -63,6 +86,8 @@ def log_event(
     message: str = "",
     level: int = logging.INFO,
 ) -> None:
+    if not logging.getLogger().isEnabledFor(level):
+        return
     fields = [f"component={component}", f"action={action}"]
     if mac:
         fields.append(f"mac={mac}")
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from collections import defaultdict
+from dataclasses import dataclass
 
 from presence_tracker.bluetooth import is_valid_mac, normalize_mac
 from presence_tracker.config import Config
@@ -11,20 +11,46 @@ from presence_tracker.convex_client import ConvexClient, DeviceRecord
 from presence_tracker.logging_utils import log_event
 from presence_tracker.state import load_known_macs, save_known_macs
 
+# A connect or disconnect arrives as a burst of PropertiesChanged signals;
+# wait this long after the first wake so the rest of the burst lands in the
+# same reconciliation cycle.
+WAKE_DEBOUNCE_SECONDS = 0.05
+
+# Floor between cycle starts when a signal cuts the sleep short. An
+# auto-reconnecting device re-established right after every probe batch would
+# otherwise drive back-to-back cycles and a Convex fetch per reconnect.
+EVENT_WAKE_MIN_SPACING_SECONDS = 10.0
+
+
+@dataclass(slots=True)
+class DeviceTrack:
+    """Per-device debounce state kept between cycles.
+
+    One record per registered MAC replaces three parallel dicts, so every
+    presence decision touches a single hash lookup and a compact slotted
+    object instead of three.
+    """
+
+    misses: int = 0
+    hits: int = 0
+    last_positive_at: float | None = None
+
 
 class PresenceLoop:
     def __init__(self, config: Config, convex: ConvexClient, bluetooth: object) -> None:
         self.config = config
         self.convex = convex
         self.bluetooth = bluetooth
-        self.misses: dict[str, int] = defaultdict(int)
-        self.hits: dict[str, int] = defaultdict(int)
-        self.last_positive_at: dict[str, float] = {}
+        self.tracks: dict[str, DeviceTrack] = {}
         self.known_macs = load_known_macs(config.paths.state_file)
+        self._persisted_known_macs = set(self.known_macs)
+        self._cycle_activity = 0
+        self._wake = asyncio.Event()
 
     async def run_forever(self) -> None:
         log_event("presence_loop", "started", result="ok", message="Presence polling loop started")
-        interval = max(1, self.config.presence.polling_interval_seconds)
+        base_interval = max(1, self.config.presence.polling_interval_seconds)
+        interval = base_interval
         while True:
             start = time.monotonic()
             try:
@@ -33,7 +59,17 @@ class PresenceLoop:
                 raise
             except Exception as exc:
                 log_event("presence_loop", "cycle", result="error", message=str(exc), level=logging.WARNING)
+            interval = self._next_interval(interval, base_interval)
             elapsed = time.monotonic() - start
+            # One structured record summarizes the whole cycle in place of
+            # per-step progress logging; per-event records still fire only on
+            # actual changes.
+            log_event(
+                "presence_loop",
+                "cycle_summary",
+                result="ok",
+                message=f"elapsed={elapsed:.2f}s activity={self._cycle_activity} interval={interval}s",
+            )
             if elapsed > interval:
                 log_event(
                     "presence_loop",
@@ -45,13 +81,44 @@ class PresenceLoop:
                 sleep_for = 0
             else:
                 sleep_for = interval - elapsed
-            await asyncio.sleep(sleep_for)
+            # Sleep out the interval, but let a BlueZ connect/disconnect
+            # signal cut it short so arrivals are reflected immediately.
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=sleep_for)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                await asyncio.sleep(WAKE_DEBOUNCE_SECONDS)
+                since_start = time.monotonic() - start
+                if since_start < EVENT_WAKE_MIN_SPACING_SECONDS:
+                    await asyncio.sleep(EVENT_WAKE_MIN_SPACING_SECONDS - since_start)
+            self._wake.clear()
+
+    def _next_interval(self, interval: int, base_interval: int) -> int:
+        # AIMD pacing: quiet cycles stretch the interval one second at a time
+        # (capped at 3x the configured value) to cut idle radio and network
+        # traffic; any activity -- a status change, a registration, or a
+        # removal -- snaps it back down so the loop reacts quickly while
+        # devices are coming and going.
+        if self._cycle_activity:
+            return max(base_interval, interval // 2)
+        return min(interval + 1, base_interval * 3)
+
+    def notify_device_event(self) -> None:
+        """Wake the polling loop early (called from BlueZ signal handlers)."""
+        self._wake.set()
 
     async def run_cycle(self) -> None:
+        self._cycle_activity = 0
         await self.process_bluetooth_removals()
 
-        devices = await self.convex.get_devices()
-        connected = {normalize_mac(mac) for mac in await self.bluetooth.get_connected_devices()}
+        # The Convex fetch is network-bound and the connected-device scan is
+        # D-Bus-bound; overlap them instead of paying both latencies serially.
+        devices, connected_raw = await asyncio.gather(
+            self.convex.get_devices(),
+            self.bluetooth.get_connected_devices(),
+        )
+        connected = {normalize_mac(mac) for mac in connected_raw}
         convex_macs = {normalize_mac(device.mac_address) for device in devices}
 
         deleted_macs = self.known_macs - convex_macs
@@ -67,9 +134,10 @@ class PresenceLoop:
                     next_known_macs.add(mac)
         self.known_macs = next_known_macs
 
-        for mac in sorted(connected - convex_macs - deleted_macs):
+        for mac in sorted(connected.difference(convex_macs, deleted_macs)):
             try:
                 await self.convex.register_pending_device(mac, None, None)
+                self._cycle_activity += 1
                 log_event(
                     "presence_loop",
                     "register_pending_fallback",
@@ -92,23 +160,35 @@ class PresenceLoop:
             for device in devices
             if not device.pending_registration and is_valid_mac(device.mac_address)
         ]
-        probe_limit = max(1, self.config.bluetooth.max_concurrent_probes)
-        passive_sem = asyncio.Semaphore(probe_limit)
-        await self.bluetooth.begin_probe_batch()
-        try:
-            probe_results = await asyncio.gather(
-                *(self._probe_registered_device(device, connected, passive_sem) for device in registered)
-            )
-            for device, is_present, via_connected in probe_results:
-                await self.apply_presence_result(device, is_present, via_connected)
-        finally:
-            await self.bluetooth.end_probe_batch()
+        # With nothing to probe, opening a probe batch would still stop and
+        # restart discovery; skip the whole block on idle deployments.
+        if registered:
+            probe_limit = max(1, self.config.bluetooth.max_concurrent_probes)
+            passive_sem = asyncio.Semaphore(probe_limit)
+            await self.bluetooth.begin_probe_batch()
+            try:
+                probe_results = await asyncio.gather(
+                    *(self._probe_registered_device(device, connected, passive_sem) for device in registered)
+                )
+                # Each result may fire an independent Convex mutation; issuing
+                # them together keeps one slow HTTP round trip from serializing
+                # the whole batch.
+                await asyncio.gather(
+                    *(
+                        self.apply_presence_result(device, is_present, via_connected)
+                        for device, is_present, via_connected in probe_results
+                    )
+                )
+            finally:
+                await self.bluetooth.end_probe_batch()
 
         known_registered = {normalize_mac(device.mac_address) for device in registered}
-        self.misses = defaultdict(int, {mac: count for mac, count in self.misses.items() if mac in known_registered})
-        self.hits = defaultdict(int, {mac: count for mac, count in self.hits.items() if mac in known_registered})
-        self.last_positive_at = {mac: ts for mac, ts in self.last_positive_at.items() if mac in known_registered}
-        save_known_macs(self.config.paths.state_file, self.known_macs)
+        self.tracks = {mac: track for mac, track in self.tracks.items() if mac in known_registered}
+        # Rewriting an identical state file every cycle needlessly wears the
+        # Pi's SD card; persist only when the set actually changed.
+        if self.known_macs != self._persisted_known_macs:
+            save_known_macs(self.config.paths.state_file, self.known_macs)
+            self._persisted_known_macs = set(self.known_macs)
 
     async def _probe_registered_device(
         self,
@@ -149,54 +229,59 @@ class PresenceLoop:
                 )
         return device, is_present, via_connected
 
-    def _seed_last_positive(self, device: DeviceRecord) -> None:
-        mac = normalize_mac(device.mac_address)
-        if mac in self.last_positive_at:
+    def _track(self, mac: str) -> DeviceTrack:
+        track = self.tracks.get(mac)
+        if track is None:
+            track = self.tracks[mac] = DeviceTrack()
+        return track
+
+    def _seed_last_positive(self, track: DeviceTrack, device: DeviceRecord) -> None:
+        if track.last_positive_at is not None:
             return
         if device.status == "present" and device.last_seen:
             seen_at = device.last_seen / 1000.0
             if (time.time() - seen_at) < self.config.presence.present_ttl_seconds:
-                self.last_positive_at[mac] = seen_at
+                track.last_positive_at = seen_at
 
-    def _within_present_ttl(self, mac: str) -> bool:
-        last_positive = self.last_positive_at.get(mac)
-        if last_positive is None:
+    def _within_present_ttl(self, track: DeviceTrack) -> bool:
+        if track.last_positive_at is None:
             return False
-        return (time.time() - last_positive) < self.config.presence.present_ttl_seconds
+        return (time.time() - track.last_positive_at) < self.config.presence.present_ttl_seconds
 
     async def apply_presence_result(self, device: DeviceRecord, is_present: bool, via_connected: bool) -> None:
         mac = normalize_mac(device.mac_address)
         absent_threshold = max(1, self.config.presence.absent_threshold)
         present_threshold = max(1, self.config.presence.present_threshold)
-        self._seed_last_positive(device)
+        track = self._track(mac)
+        self._seed_last_positive(track, device)
 
         if is_present:
-            self.last_positive_at[mac] = time.time()
-            self.misses.pop(mac, None)
+            track.last_positive_at = time.time()
+            track.misses = 0
             if device.status != "present":
                 if via_connected:
                     # An active OS-level connection is ground truth; trust it
                     # immediately rather than debouncing the strongest signal.
-                    self.hits.pop(mac, None)
+                    track.hits = 0
                 else:
                     # Weaker probe-only signal: debounce by present_threshold so a
                     # single noisy hit cannot flip a device to present.
-                    self.hits[mac] += 1
-                    if self.hits[mac] < present_threshold:
+                    track.hits += 1
+                    if track.hits < present_threshold:
                         return
-                    self.hits.pop(mac, None)
+                    track.hits = 0
                 await self.transition_status(device, "present")
             else:
                 await self.touch_device_presence(device)
             return
 
-        if device.status == "present" and self._within_present_ttl(mac):
-            self.misses.pop(mac, None)
+        if device.status == "present" and self._within_present_ttl(track):
+            track.misses = 0
             return
 
-        self.hits.pop(mac, None)
-        self.misses[mac] += 1
-        if self.misses[mac] >= absent_threshold and device.status != "absent":
+        track.hits = 0
+        track.misses += 1
+        if track.misses >= absent_threshold and device.status != "absent":
             await self.transition_status(device, "absent")
 
     async def process_bluetooth_removals(self) -> None:
@@ -246,9 +331,8 @@ class PresenceLoop:
     async def remove_mac_from_adapter(self, mac: str, action: str, success_message: str) -> bool:
         removed = await self.bluetooth.remove_device(mac)
         if removed:
-            self.misses.pop(mac, None)
-            self.hits.pop(mac, None)
-            self.last_positive_at.pop(mac, None)
+            self._cycle_activity += 1
+            self.tracks.pop(mac, None)
             log_event("presence_loop", action, mac=mac, result="ok", message=success_message)
             return True
         log_event(
@@ -279,10 +363,13 @@ class PresenceLoop:
         mac = normalize_mac(device.mac_address)
         try:
             await self.convex.update_device_status(mac, status)
+            self._cycle_activity += 1
             if status == "present":
-                self.last_positive_at[mac] = time.time()
+                self._track(mac).last_positive_at = time.time()
             elif status == "absent":
-                self.last_positive_at.pop(mac, None)
+                track = self.tracks.get(mac)
+                if track is not None:
+                    track.last_positive_at = None
             log_event("presence_loop", "status_update", mac=mac, result=status, message=f"{device.status} -> {status}")
         except Exception as exc:
             log_event("presence_loop", "status_update", mac=mac, result="error", message=str(exc), level=logging.WARNING)
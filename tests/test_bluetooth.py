@@ -1,8 +1,11 @@
 import asyncio
 
+from dbus_next import Variant
 from dbus_next.errors import DBusError
 
 from presence_tracker.bluetooth import (
+    DEVICE,
+    OBJECTS_RESYNC_SECONDS,
     BlueZPresenceMonitor,
     CommandOutput,
     adapter_hci_name,
@@ -192,3 +195,120 @@ def test_probe_device_connects_audio_devices_for_presence(monkeypatch) -> None:
 
     assert asyncio.run(monitor.probe_device("F0:F5:64:4E:E5:05"))
     assert disconnected
+
+
+DEV_PATH = "/org/bluez/hci0/dev_AA_BB_CC_DD_EE_FF"
+
+
+def _cached_monitor(tree):
+    # Monitor whose object cache is primed from a fake ObjectManager, with a
+    # fetch counter to assert when the bus is (not) hit.
+    monitor = BlueZPresenceMonitor(BluetoothConfig())
+    monitor._objects_signals_ok = True
+    fetches = {"count": 0}
+
+    class FakeObjectManager:
+        async def call_get_managed_objects(self):
+            fetches["count"] += 1
+            return {path: {iface: dict(props) for iface, props in ifaces.items()} for path, ifaces in tree.items()}
+
+    async def _interface(bus_name, path, interface):
+        return FakeObjectManager()
+
+    monitor._interface = _interface
+    return monitor, fetches
+
+
+def test_object_cache_tracks_interface_add_and_remove() -> None:
+    monitor, fetches = _cached_monitor({})
+    assert asyncio.run(monitor.get_managed_objects()) == {}
+
+    monitor._on_interfaces_added(DEV_PATH, {DEVICE: {"Connected": Variant("b", True)}})
+    assert DEVICE in asyncio.run(monitor.get_managed_objects())[DEV_PATH]
+
+    monitor.connected_state["AA:BB:CC:DD:EE:FF"] = True
+    monitor._audio_capable["AA:BB:CC:DD:EE:FF"] = True
+    monitor._on_interfaces_removed(DEV_PATH, [DEVICE])
+    assert DEV_PATH not in asyncio.run(monitor.get_managed_objects())
+    assert "AA:BB:CC:DD:EE:FF" not in monitor.connected_state
+    assert "AA:BB:CC:DD:EE:FF" not in monitor._audio_capable
+    assert fetches["count"] == 1
+
+
+def test_object_cache_applies_property_patches_and_invalidations() -> None:
+    tree = {DEV_PATH: {DEVICE: {"Connected": Variant("b", False), "RSSI": Variant("n", -60)}}}
+    monitor, fetches = _cached_monitor(tree)
+    asyncio.run(monitor.get_managed_objects())
+
+    monitor._patch_cached_device(DEV_PATH, {"Connected": Variant("b", True)}, ["RSSI"])
+    device = asyncio.run(monitor.get_device_properties(DEV_PATH))
+    assert device["Connected"].value is True
+    assert "RSSI" not in device
+    assert fetches["count"] == 1
+
+
+def test_object_cache_resync_reseeds_connected_state() -> None:
+    tree = {DEV_PATH: {DEVICE: {"Connected": Variant("b", True)}}}
+    monitor, fetches = _cached_monitor(tree)
+    asyncio.run(monitor.get_managed_objects())
+    assert monitor.connected_state == {"AA:BB:CC:DD:EE:FF": True}
+
+    # A dropped signal leaves the connected cache stale; the periodic full
+    # resync must re-fetch the tree and correct it.
+    monitor.connected_state["AA:BB:CC:DD:EE:FF"] = False
+    monitor._objects_synced_at -= OBJECTS_RESYNC_SECONDS + 1
+    asyncio.run(monitor.get_managed_objects())
+    assert fetches["count"] == 2
+    assert monitor.connected_state["AA:BB:CC:DD:EE:FF"] is True
+
+    # A device whose removal signal was dropped and that has since vanished
+    # from the tree must not survive the resync as a phantom connection.
+    del tree[DEV_PATH]
+    monitor._objects_synced_at -= OBJECTS_RESYNC_SECONDS + 1
+    asyncio.run(monitor.get_managed_objects())
+    assert fetches["count"] == 3
+    assert "AA:BB:CC:DD:EE:FF" not in monitor.connected_state
+
+
+def test_object_cache_disabled_without_signal_subscriptions() -> None:
+    monitor, fetches = _cached_monitor({DEV_PATH: {DEVICE: {}}})
+    monitor._objects_signals_ok = False
+
+    asyncio.run(monitor.get_managed_objects())
+    asyncio.run(monitor.get_managed_objects())
+    assert fetches["count"] == 2
+    assert monitor._objects is None
+
+
+def test_get_managed_objects_returns_a_detached_mapping() -> None:
+    monitor, fetches = _cached_monitor({DEV_PATH: {DEVICE: {}}})
+    asyncio.run(monitor.get_managed_objects()).clear()
+    assert DEV_PATH in asyncio.run(monitor.get_managed_objects())
+    assert fetches["count"] == 1
+
+
+def test_probe_batch_disconnects_do_not_wake_the_presence_loop() -> None:
+    # begin_probe_batch disconnects OS-connected devices itself; the Connected
+    # flips it causes arrive while the sweep is still running and must not
+    # fire the wake callback, or every cycle re-triggers itself.
+    monitor = BlueZPresenceMonitor(BluetoothConfig())
+    fired = []
+    monitor.on_connection_event = lambda: fired.append(1)
+    monitor.connected_state["AA:BB:CC:DD:EE:FF"] = True
+
+    async def stop_discovery():
+        pass
+
+    async def get_connected_devices():
+        return {"AA:BB:CC:DD:EE:FF"}
+
+    async def disconnect_audio_capable_device(mac):
+        monitor._record_property_change(mac, {"Connected": Variant("b", False)})
+
+    monitor.stop_discovery = stop_discovery
+    monitor.get_connected_devices = get_connected_devices
+    monitor.disconnect_audio_capable_device = disconnect_audio_capable_device
+
+    asyncio.run(monitor.begin_probe_batch())
+    assert fired == []
+    assert monitor._probe_batch_depth == 1
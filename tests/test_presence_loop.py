@@ -166,3 +166,30 @@ def test_removal_request_removes_and_acknowledges(tmp_path) -> None:
 
     assert bluetooth.removed == ["AA:BB:CC:DD:EE:FF"]
     assert convex.acks == [("req1", "AA:BB:CC:DD:EE:FF")]
+
+
+def test_adaptive_interval_backs_off_and_recovers(tmp_path) -> None:
+    config = Config.from_dict({"paths": {"state_file": str(tmp_path / "state.json")}})
+    config.normalize()
+    loop = PresenceLoop(config, FakeConvex(), FakeBluetooth())
+    base = 60
+
+    loop._cycle_activity = 0
+    assert loop._next_interval(base, base) == base + 1
+    assert loop._next_interval(base * 3, base) == base * 3  # capped at 3x
+
+    loop._cycle_activity = 1
+    assert loop._next_interval(base * 3, base) == base * 3 // 2
+    assert loop._next_interval(base, base) == base  # never below the floor
+
+
+def test_registrations_count_as_cycle_activity(tmp_path) -> None:
+    # A cycle that registers a new pending device is not idle; the adaptive
+    # interval must not keep stretching while devices are arriving.
+    config = Config.from_dict({"paths": {"state_file": str(tmp_path / "state.json")}})
+    config.normalize()
+    loop = PresenceLoop(config, FakeConvex(devices=[]), FakeBluetooth(connected={"AA:BB:CC:DD:EE:FF"}))
+
+    run(loop.run_cycle())
+
+    assert loop._cycle_activity == 1